@@ -0,0 +1,224 @@
+"""
+Single entry point for the faculty scrapers.
+
+    python cli.py crawl ualberta
+    python cli.py parse srm saved/*.html -o srm.jsonl
+    python cli.py export srm.jsonl -o srm.csv
+    python cli.py reextract archive/srm.warc.gz -o srm.jsonl
+    python cli.py index umanitoba_faculty_full.csv srm.jsonl
+    python cli.py search "bayesian statistics" --designation professor
+
+Heavy modules (selenium, webdriver_manager, bs4, numpy, pandas) are imported
+only by the subcommand that needs them, so everything except `crawl` starts
+without a browser and without paying for selenium's import.
+"""
+import argparse
+import json
+import os
+import sys
+
+# Site name -> crawler script run by `crawl`
+CRAWLERS = {
+    "ualberta": "code_webscrape",
+    "srm": "code_sr",
+    "vit": "code_vit",
+    "umanitoba": "code_uni",
+}
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def cmd_crawl(args):
+    import runpy
+
+    if args.refresh_driver:
+        from driver_cache import chromedriver_path
+        chromedriver_path(refresh=True)
+
+    if args.archive_dir:
+        import crawl_archive
+        crawl_archive.ARCHIVE_DIR = args.archive_dir
+
+    runpy.run_module(CRAWLERS[args.site], run_name="__main__")
+    return 0
+
+
+def cmd_parse(args):
+    from extractors import PARSERS
+
+    parser = PARSERS[args.site]
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        for path in args.files:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                html = f.read()
+            for record in parser(html):
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Parsed {count} records from {len(args.files)} files", file=sys.stderr)
+    return 0
+
+
+def cmd_reextract(args):
+    from crawl_archive import reextract
+
+    for path in args.archives:
+        for required in (path, path + ".idx"):
+            if not os.path.isfile(required):
+                print(f"error: archive file not found: {required}", file=sys.stderr)
+                return 1
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    count = 0
+    try:
+        for path in args.archives:
+            for record in reextract(path, workers=args.jobs, latest_only=not args.all_versions):
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Re-extracted {count} records from {len(args.archives)} archives", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args):
+    import csv
+
+    records = []
+    fieldnames = []
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                for key in record:
+                    if key not in fieldnames:
+                        fieldnames.append(key)
+                records.append({
+                    key: args.sep.join(value) if isinstance(value, list) else value
+                    for key, value in record.items()
+                })
+
+    if not records:
+        print("No data to export - skipping CSV write", file=sys.stderr)
+        return 1
+
+    with open(args.output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(records)
+
+    print(f"Data saved to {args.output} ({len(records)} records)", file=sys.stderr)
+    return 0
+
+
+def cmd_index(args):
+    from research_index import ResearchIndex
+
+    index = ResearchIndex(args.index_dir)
+    added = index.add_files(args.files, site=args.site, department=args.department, force=args.force)
+    if args.compact:
+        index.compact()
+    print(f"Indexed {added} profiles ({len(index)} searchable)", file=sys.stderr)
+    return 0
+
+
+def cmd_search(args):
+    from research_index import ResearchIndex
+
+    index = ResearchIndex(args.index_dir)
+    try:
+        results = index.search(args.query, k=args.top, site=args.site,
+                               department=args.department, designation=args.designation)
+    except FileNotFoundError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    for score, doc in results:
+        if args.json:
+            print(json.dumps(dict(doc, score=round(score, 4)), ensure_ascii=False))
+            continue
+        print(f"{score:7.3f}  {doc['name']} <{doc['email'] or 'no email'}> [{doc['site']}]")
+        details = ", ".join(part for part in (doc["designation"], doc["department"]) if part)
+        if details:
+            print(f"         {details}")
+        if doc["interests"]:
+            print(f"         {'; '.join(doc['interests'])[:160]}")
+    if not results:
+        print("No matching profiles", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Scrape and parse college faculty directories")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    crawl = sub.add_parser("crawl", help="run a site's browser crawler")
+    crawl.add_argument("site", choices=sorted(CRAWLERS))
+    crawl.add_argument("--refresh-driver", action="store_true",
+                       help="re-resolve chromedriver instead of using the cached path")
+    crawl.add_argument("--archive-dir", help="where to write <site>.warc.gz (default: ./archive)")
+    crawl.set_defaults(func=cmd_crawl)
+
+    parse = sub.add_parser("parse", help="run the extractors over saved HTML (no browser)")
+    parse.add_argument("site", choices=sorted(CRAWLERS))
+    parse.add_argument("files", nargs="+", help="saved HTML pages or DOM snapshots")
+    parse.add_argument("-o", "--output", help="JSON-lines output file (default: stdout)")
+    parse.set_defaults(func=cmd_parse)
+
+    reextract = sub.add_parser("reextract", help="replay crawl archives through the current extractors")
+    reextract.add_argument("archives", nargs="+", help="<site>.warc.gz files written during crawls")
+    reextract.add_argument("-o", "--output", help="JSON-lines output file (default: stdout)")
+    reextract.add_argument("-j", "--jobs", type=positive_int, help="worker processes (default: CPU count)")
+    reextract.add_argument("--all-versions", action="store_true",
+                           help="replay every snapshot instead of only the newest per URL")
+    reextract.set_defaults(func=cmd_reextract)
+
+    export = sub.add_parser("export", help="convert parsed JSON-lines records to CSV")
+    export.add_argument("files", nargs="+", help="JSON-lines files written by `parse` or `reextract`")
+    export.add_argument("-o", "--output", required=True, help="CSV file to write")
+    export.add_argument("--sep", default="; ", help="separator for list fields (default: '; ')")
+    export.set_defaults(func=cmd_export)
+
+    index = sub.add_parser("index", help="add scraper CSV / JSON-lines output to the research index")
+    index.add_argument("files", nargs="+", help="scraper output; files unchanged since the last run are skipped")
+    index.add_argument("--site", choices=sorted(CRAWLERS), help="site of the files (default: detect from columns)")
+    index.add_argument("--department", help="department for rows that do not name one")
+    index.add_argument("--index-dir", help="index directory (default: ./index)")
+    index.add_argument("--force", action="store_true", help="re-index files even if unchanged")
+    index.add_argument("--compact", action="store_true", help="merge segments and drop superseded profiles")
+    index.set_defaults(func=cmd_index)
+
+    search = sub.add_parser("search", help="ranked search over research interests, bios and positions")
+    search.add_argument("query")
+    search.add_argument("-k", "--top", type=positive_int, default=10, help="number of results (default: 10)")
+    search.add_argument("--site", choices=sorted(CRAWLERS))
+    search.add_argument("--department", help="case-insensitive substring of the department")
+    search.add_argument("--designation", help="case-insensitive substring of the designation")
+    search.add_argument("--index-dir", help="index directory (default: ./index)")
+    search.add_argument("--json", action="store_true", help="print matches as JSON lines")
+    search.set_defaults(func=cmd_search)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
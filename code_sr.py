@@ -3,60 +3,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
-from bs4 import BeautifulSoup
 import time
 import csv
-import re
+
+from crawl_archive import archive_page
+from extractors import parse_srm_profile
 
 def extract_faculty_info(driver):
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    data = {
-        "Name": "",
-        "Designation": "",
-        "Email": "",
-        "Bio": "",
-        "Research Interests": ""
-    }
-
-    name_el = soup.find(['h1', 'h2'], class_='elementor-heading-title')
-    if name_el:
-        data["Name"] = name_el.get_text(strip=True)
-
-    heading_tags = soup.find_all(['h2', 'h3', 'h4'])
-    for tag in heading_tags:
-        if 'Professor' in tag.get_text() or 'Head' in tag.get_text():
-            data["Designation"] = tag.get_text(strip=True)
-            break
-
-    email_tag = soup.find('a', href=re.compile(r'mailto:', re.I))
-    if email_tag:
-        data["Email"] = email_tag.get_text(strip=True)
-    else:
-        email_fallback = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', soup.get_text())
-        if email_fallback:
-            data["Email"] = email_fallback.group()
-
-    paragraphs = soup.find_all('p')
-    for p in paragraphs:
-        text = p.get_text(strip=True)
-        if len(text) > 100 and not re.search(r'@|research|course', text, re.I):
-            data["Bio"] = text
-            break
-
-    for heading in soup.find_all(['h2', 'h3', 'h4']):
-        if 'research interest' in heading.get_text(strip=True).lower():
-            interests = []
-            next_tag = heading.find_next_sibling()
-            while next_tag and next_tag.name in ['ul', 'ol', 'p']:
-                if next_tag.name in ['ul', 'ol']:
-                    interests += [li.get_text(strip=True) for li in next_tag.find_all('li')]
-                elif next_tag.name == 'p':
-                    interests.append(next_tag.get_text(strip=True))
-                next_tag = next_tag.find_next_sibling()
-            data["Research Interests"] = "; ".join(interests)
-            break
-
-    return data
+    html = driver.page_source
+    archive_page("srm", driver.current_url, html)
+    return parse_srm_profile(html)[0]
 
 # Setup
 driver = webdriver.Chrome()
@@ -5,10 +5,13 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
 import time
 import csv
 
+from crawl_archive import archive_page
+from driver_cache import chromedriver_path
+from extractors import UMANITOBA_CONTENT_SELECTOR, parse_umanitoba_directory, parse_umanitoba_profile
+
 
 def setup_driver():
     chrome_options = Options()
@@ -16,7 +19,7 @@ def setup_driver():
     chrome_options.add_argument("--disable-notifications")
     chrome_options.add_argument("--disable-popup-blocking")
     chrome_options.add_argument("--headless=new")  # Optional: Run in headless mode
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
     return driver
 
 
@@ -36,14 +39,9 @@ def extract_faculty_links(driver, url):
 
     faculty_links = []
     try:
-        people_divs = driver.find_elements(By.CSS_SELECTOR, 'div.clearfix.wysiwyg.field.field--name-field-basic-text-content.field--type-text-long.field--label-hidden.field__item')
-        for div in people_divs:
-            try:
-                link = div.find_element(By.TAG_NAME, 'a').get_attribute('href')
-                name = div.text.strip().split("\n")[0]
-                faculty_links.append((name, link))
-            except NoSuchElementException:
-                continue
+        html = driver.page_source
+        archive_page("umanitoba", url, html, kind="listing")
+        faculty_links = parse_umanitoba_directory(html, url)
     except Exception as e:
         print(f"Error extracting faculty links: {e}")
 
@@ -54,32 +52,23 @@ def extract_faculty_info(driver, name, link):
     driver.get(link)
     time.sleep(1)  # Ensure page loads fully
 
-    data = {'Name': name, 'H2 Headings': [], 'Paragraphs': [], 'Research Interests': []}
-
     try:
-        main_div = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'div.clearfix.wysiwyg.field.field--name-field-basic-text-content.field--type-text-long.field--label-hidden.field__item'))
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, UMANITOBA_CONTENT_SELECTOR))
         )
-        headings = main_div.find_elements(By.TAG_NAME, 'h2')
-        paragraphs = main_div.find_elements(By.TAG_NAME, 'p')
-
-        data['H2 Headings'] = [h.text.strip() for h in headings if h.text.strip()]
-        data['Paragraphs'] = [p.text.strip() for p in paragraphs if p.text.strip()]
-
     except TimeoutException:
-        print(f"Could not find main content div for {name}")
+        pass
 
     # Scroll to research section
     try:
         research_section = driver.find_element(By.ID, 'research-and-teaching-interests')
         driver.execute_script("arguments[0].scrollIntoView();", research_section)
-        research_div = research_section.find_element(By.CSS_SELECTOR, 'div.clearfix.wysiwyg.field.field--name-body.field--type-text-with-summary.field--label-hidden.field__item')
-        items = research_div.find_elements(By.TAG_NAME, 'li')
-        data['Research Interests'] = [li.text.strip() for li in items if li.text.strip()]
     except NoSuchElementException:
-        print(f"No research section found for {name}")
+        pass
 
-    return data
+    html = driver.page_source
+    archive_page("umanitoba", link, html)
+    return parse_umanitoba_profile(html, name)[0]
 
 
 def save_to_csv(data_list, filename):
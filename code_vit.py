@@ -5,19 +5,22 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
 import time
 import csv
 import os
+from urllib.parse import quote
+
+from crawl_archive import archive_page
+from driver_cache import chromedriver_path
+from extractors import parse_vit_modal
 
 # Setup Chrome options
 options = Options()
 # options.add_argument('--headless')  # Uncomment for headless mode
 options.add_argument('--start-maximized')
 
-# Path to ChromeDriver (update this to your system's path)
-from webdriver_manager.chrome import ChromeDriverManager
-driver_path = ChromeDriverManager().install()
+# Path to ChromeDriver (resolved once by webdriver_manager, then cached)
+driver_path = chromedriver_path()
 
 driver = webdriver.Chrome(service=Service(driver_path), options=options)
 
@@ -69,33 +72,19 @@ for index in range(total_cards):
         driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", lightbox)
         time.sleep(2)  # Add a short delay to allow content to load
 
-        soup = BeautifulSoup(lightbox.get_attribute('innerHTML'), 'html.parser')
-
-        # Extract information
-        resume_section = soup.find('div', class_='resume-section-content')
-        if resume_section:
-            primary_text = resume_section.find('div', class_='text-primary').text.strip() if resume_section.find('div', class_='text-primary') else "Not Found"
-            subheading_text = resume_section.find('div', class_='subheading mb-5').text.strip() if resume_section.find('div', class_='subheading mb-5') else "Not Found"
-        else:
-            primary_text = "Not Found"
-            subheading_text = "Not Found"
-
-        research_interest_section = soup.find('div', class_='resume-section-content table-responsive-sm')
-        if research_interest_section:
-            ul_element = research_interest_section.find('ul', class_='fa-ul mb-0')
-            if ul_element:
-                research_interests = [li.text.strip() for li in ul_element.find_all('li')]
-            else:
-                research_interests = ["Not Found"]
+        # Extract information and store the data
+        html = lightbox.get_attribute('innerHTML')
+        info = parse_vit_modal(html)[0]
+        # The modal has no URL of its own; key the snapshot on the professor,
+        # not the card position, which changes between crawls
+        if info["Name"] != "Not Found":
+            archive_page("vit", f"{url}#faculty={quote(info['Name'])}", html)
         else:
-            research_interests = ["Not Found"]
-
-        # Store the data
-        faculty_data.append({
-            "Name": primary_text,
-            "Designation": subheading_text,
-            "Research Interests": research_interests,
-        })
+            archive_page("vit", f"{url}#card-{index+1}", html, kind="listing")
+        faculty_data.append(info)
+        primary_text = info["Name"]
+        subheading_text = info["Designation"]
+        research_interests = info["Research Interests"]
 
         print(f"\nFaculty #{index+1}")
         print(f"Name: {primary_text}")
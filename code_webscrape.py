@@ -6,10 +6,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
 import logging
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from datetime import datetime
+
+from crawl_archive import archive_page
+from extractors import parse_faculty_card, parse_staff_positions, parse_ualberta_page
 
 class FacultyDirectoryScraper:
     def __init__(self, headless=True, timeout=15):
@@ -68,77 +69,10 @@ class FacultyDirectoryScraper:
             return False
 
     def _parse_staff_positions(self, faculty_card):
-        positions = []
-        try:
-            position_elements = faculty_card.select("p.staff-position")
-
-            for pos in position_elements:
-                if pos.find("br"):
-                    # Positions separated by <br> tags
-                    for content in pos.contents:
-                        if getattr(content, 'name', None) == "br":
-                            continue
-                        text = content.strip() if isinstance(content, str) else content.get_text(" ", strip=True)
-                        if text:
-                            positions.append(text)
-                elif pos.select("span"):
-                    # Positions in separate <span> elements
-                    positions.extend([
-                        span.get_text(" ", strip=True)
-                        for span in pos.select("span")
-                        if span.get_text(strip=True)
-                    ])
-                else:
-                    # Plain text position
-                    text = pos.get_text(" ", strip=True)
-                    if text:
-                        positions.append(text)
-
-            # Clean and filter results
-            positions = [p for p in positions if p and p.lower() not in ["n/a", "null", "none", ""]]
-
-            # Remove duplicates preserving order
-            seen = set()
-            return [p for p in positions if not (p in seen or seen.add(p))]
-
-        except Exception as e:
-            self.logger.warning(f"Error parsing positions: {str(e)}")
-            return ["Position information not available"]
+        return parse_staff_positions(faculty_card)
 
     def parse_faculty_card(self, faculty_card):
-        try:
-            name_element = faculty_card.select_one("div.col-12 a.CoveoResultLink")
-            name = name_element.get_text(strip=True) if name_element else "N/A"
-            profile_link = name_element.get('href') if name_element else "N/A"
-
-            staff_positions = self._parse_staff_positions(faculty_card)
-
-            email_element = faculty_card.select_one("div.col-12 a[href^='mailto:']")
-            email = email_element.get_text(strip=True) if email_element else "N/A"
-
-            keyword_elements = faculty_card.select("span.CoveoFieldValue")
-            keywords = list({kw.get_text(strip=True) for kw in keyword_elements if kw.get_text(strip=True)})
-
-            bio_element = faculty_card.select_one("p.CoveoExcerpt")
-            bio = bio_element.get_text(" ", strip=True) if bio_element else "N/A"
-
-            import_time = datetime.now().isoformat()
-
-            self.logger.info(f"Scraped: {name} | Email: {email} | Positions: {staff_positions} | Keywords: {len(keywords)}")
-
-            return {
-                "name": name,
-                "profile_link": profile_link,
-                "staff_positions": staff_positions,
-                "email": email,
-                "keywords": keywords,
-                "bio": bio,
-                "import_time": import_time
-            }
-
-        except Exception as e:
-            self.logger.error(f"Error parsing faculty card: {str(e)}")
-            return None
+        return parse_faculty_card(faculty_card)
 
     
 
@@ -196,15 +130,11 @@ class FacultyDirectoryScraper:
     def scrape_current_page(self):
         """Scrape faculty cards on the current page"""
         try:
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            faculty_cards = soup.select("div.CoveoResult")
-
-            count = 0
-            for card in faculty_cards:
-                data = self.parse_faculty_card(card)
-                if data:
-                    self.faculty_data.append(data)
-                    count += 1
+            html = self.driver.page_source
+            archive_page("ualberta", self.driver.current_url, html)
+            records = parse_ualberta_page(html)
+            self.faculty_data.extend(records)
+            count = len(records)
             self.logger.info(f"Scraped {count} faculty cards on current page")
             return count
         except Exception as e:
@@ -0,0 +1,169 @@
+"""
+Append-only, WARC-style archive of every page the crawlers fetch.
+
+Each snapshot is written as its own gzip member holding a WARC/1.1
+"resource" record, so `<site>.warc.gz` is a valid concatenated-gzip WARC
+file. A tab-separated sidecar index (`<site>.warc.gz.idx`) maps every record
+to its byte offset and compressed length:
+
+    offset  length  site  kind  date  url
+
+`kind` is "page" for snapshots the site's extractor parses and "listing"
+for navigation pages kept only for reference. A page's URL is its identity
+(the newest snapshot per URL is replayed), so it must name one profile:
+VIT modals have no URL of their own and are keyed by the professor's name.
+
+The reader memory-maps the archive and decompresses single records by
+offset, and `reextract` replays the archive through the current extractors
+in a process pool - fixing a broken selector no longer means re-crawling.
+"""
+import atexit
+import gzip
+import mmap
+import os
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+ARCHIVE_DIR = os.environ.get("CRAWL_ARCHIVE_DIR", "archive")
+
+_writers = {}
+
+
+def archive_path(site, directory=None):
+    return os.path.join(directory or ARCHIVE_DIR, f"{site}.warc.gz")
+
+
+class ArchiveWriter:
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".idx"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._archive = open(path, "ab")
+        self._index = open(self.index_path, "a", encoding="utf-8")
+
+    def write(self, site, url, html, kind="page"):
+        """Append one snapshot and its index line; returns the record offset"""
+        body = html.encode("utf-8")
+        date = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        header = (
+            "WARC/1.1\r\n"
+            "WARC-Type: resource\r\n"
+            f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+            f"WARC-Date: {date}\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"X-Crawl-Site: {site}\r\n"
+            f"X-Crawl-Kind: {kind}\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        record = gzip.compress(header + body + b"\r\n\r\n")
+
+        offset = self._archive.seek(0, os.SEEK_END)
+        self._archive.write(record)
+        self._archive.flush()
+        # The index line is written only once the record is on disk, so a
+        # crash can never leave the index pointing at a partial record
+        self._index.write(f"{offset}\t{len(record)}\t{site}\t{kind}\t{date}\t{url}\n")
+        self._index.flush()
+        return offset
+
+    def close(self):
+        self._archive.close()
+        self._index.close()
+
+
+def archive_page(site, url, html, kind="page"):
+    """Record a fetched page in the site's archive; never breaks the crawl"""
+    try:
+        writer = _writers.get(site)
+        if writer is None:
+            writer = _writers[site] = ArchiveWriter(archive_path(site))
+        writer.write(site, url, html, kind)
+    except Exception as e:
+        print(f"Could not archive {url}: {e}")
+
+
+@atexit.register
+def _close_writers():
+    for writer in _writers.values():
+        writer.close()
+    _writers.clear()
+
+
+class ArchiveReader:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def entries(self, latest_only=True):
+        """Index entries as dicts, keeping only the newest snapshot per URL by default"""
+        entries = []
+        with open(self.path + ".idx", encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t", 5)
+                if len(parts) != 6:
+                    continue
+                offset, length, site, kind, date, url = parts
+                entries.append({
+                    "offset": int(offset), "length": int(length),
+                    "site": site, "kind": kind, "date": date, "url": url,
+                })
+        if latest_only:
+            newest = {entry["url"]: entry for entry in entries}
+            entries = sorted(newest.values(), key=lambda entry: entry["offset"])
+        return entries
+
+    def read(self, offset, length):
+        """Decompress one record and return its HTML body"""
+        record = gzip.decompress(self._map[offset:offset + length])
+        _, _, body = record.partition(b"\r\n\r\n")
+        if body.endswith(b"\r\n\r\n"):
+            body = body[:-4]
+        return body.decode("utf-8")
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+def _reextract_chunk(path, entries):
+    from extractors import PARSERS
+
+    records = []
+    with ArchiveReader(path) as reader:
+        for entry in entries:
+            try:
+                html = reader.read(entry["offset"], entry["length"])
+                for record in PARSERS[entry["site"]](html):
+                    record["source_url"] = entry["url"]
+                    records.append(record)
+            except Exception as e:
+                print(f"Error re-extracting {entry['url']}: {e}", file=sys.stderr)
+    return records
+
+
+def reextract(path, workers=None, chunk_size=64, latest_only=True):
+    """Replay an archive through the current extractors; yields record dicts in archive order"""
+    with ArchiveReader(path) as reader:
+        entries = [entry for entry in reader.entries(latest_only) if entry["kind"] == "page"]
+
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    if not chunks:
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for records in pool.map(_reextract_chunk, [path] * len(chunks), chunks):
+            yield from records
@@ -0,0 +1,44 @@
+"""
+Cache the chromedriver path resolved by webdriver_manager.
+
+ChromeDriverManager().install() does version resolution (and may hit the
+network) on every run. The resolved path is stored in a small cache file and
+reused as long as the binary still exists; webdriver_manager is only imported
+when the cache is missing or stale.
+"""
+import os
+
+CACHE_FILE = os.environ.get(
+    "CHROMEDRIVER_PATH_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "college_prof_webscraping", "chromedriver_path"),
+)
+
+
+def _read_cached_path():
+    try:
+        with open(CACHE_FILE, encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    if path and os.path.isfile(path) and os.access(path, os.X_OK):
+        return path
+    return None
+
+
+def chromedriver_path(refresh=False):
+    """Return a usable chromedriver path, resolving it only on a cache miss"""
+    if not refresh:
+        path = _read_cached_path()
+        if path:
+            return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    path = ChromeDriverManager().install()
+
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            f.write(path)
+    except OSError as e:
+        print(f"Could not cache chromedriver path: {e}")
+    return path
@@ -0,0 +1,285 @@
+"""
+Browser-free extractors for every supported faculty site.
+
+Each parser takes raw HTML (a saved page or a rendered DOM snapshot) and
+returns a list of record dicts, so the same code runs during a live crawl
+and when re-parsing saved pages with no browser at all. Only BeautifulSoup
+is needed here - keep selenium and pandas out of this module.
+"""
+import logging
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, NavigableString
+from bs4.element import PreformattedString
+
+logger = logging.getLogger('FacultyScraper')
+
+UMANITOBA_CONTENT_SELECTOR = 'div.clearfix.wysiwyg.field.field--name-field-basic-text-content.field--type-text-long.field--label-hidden.field__item'
+UMANITOBA_RESEARCH_SELECTOR = 'div.clearfix.wysiwyg.field.field--name-body.field--type-text-with-summary.field--label-hidden.field__item'
+
+# Elements that sit on their own lines in rendered text
+BLOCK_TAGS = {
+    'br', 'p', 'div', 'li', 'ul', 'ol', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr', 'table',
+    'section', 'article', 'header', 'footer', 'blockquote', 'pre', 'dl', 'dt', 'dd',
+}
+# Elements whose text is never rendered
+HIDDEN_TAGS = {'script', 'style', 'template', 'noscript'}
+
+
+# ---------------------------------------------------------------------------
+# UAlberta (Coveo search results) - code_webscrape.py
+# ---------------------------------------------------------------------------
+
+def parse_staff_positions(faculty_card):
+    positions = []
+    try:
+        position_elements = faculty_card.select("p.staff-position")
+
+        for pos in position_elements:
+            if pos.find("br"):
+                # Positions separated by <br> tags
+                for content in pos.contents:
+                    if getattr(content, 'name', None) == "br":
+                        continue
+                    text = content.strip() if isinstance(content, str) else content.get_text(" ", strip=True)
+                    if text:
+                        positions.append(text)
+            elif pos.select("span"):
+                # Positions in separate <span> elements
+                positions.extend([
+                    span.get_text(" ", strip=True)
+                    for span in pos.select("span")
+                    if span.get_text(strip=True)
+                ])
+            else:
+                # Plain text position
+                text = pos.get_text(" ", strip=True)
+                if text:
+                    positions.append(text)
+
+        # Clean and filter results
+        positions = [p for p in positions if p and p.lower() not in ["n/a", "null", "none", ""]]
+
+        # Remove duplicates preserving order
+        seen = set()
+        return [p for p in positions if not (p in seen or seen.add(p))]
+
+    except Exception as e:
+        logger.warning(f"Error parsing positions: {str(e)}")
+        return ["Position information not available"]
+
+
+def parse_faculty_card(faculty_card):
+    try:
+        name_element = faculty_card.select_one("div.col-12 a.CoveoResultLink")
+        name = name_element.get_text(strip=True) if name_element else "N/A"
+        profile_link = name_element.get('href') if name_element else "N/A"
+
+        staff_positions = parse_staff_positions(faculty_card)
+
+        email_element = faculty_card.select_one("div.col-12 a[href^='mailto:']")
+        email = email_element.get_text(strip=True) if email_element else "N/A"
+
+        keyword_elements = faculty_card.select("span.CoveoFieldValue")
+        keywords = list({kw.get_text(strip=True) for kw in keyword_elements if kw.get_text(strip=True)})
+
+        bio_element = faculty_card.select_one("p.CoveoExcerpt")
+        bio = bio_element.get_text(" ", strip=True) if bio_element else "N/A"
+
+        import_time = datetime.now().isoformat()
+
+        logger.info(f"Scraped: {name} | Email: {email} | Positions: {staff_positions} | Keywords: {len(keywords)}")
+
+        return {
+            "name": name,
+            "profile_link": profile_link,
+            "staff_positions": staff_positions,
+            "email": email,
+            "keywords": keywords,
+            "bio": bio,
+            "import_time": import_time
+        }
+
+    except Exception as e:
+        logger.error(f"Error parsing faculty card: {str(e)}")
+        return None
+
+
+def parse_ualberta_page(html):
+    """Parse every faculty card on a rendered Coveo results page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    records = []
+    for card in soup.select("div.CoveoResult"):
+        data = parse_faculty_card(card)
+        if data:
+            records.append(data)
+    return records
+
+
+# ---------------------------------------------------------------------------
+# SRM (Elementor profile pages) - code_sr.py
+# ---------------------------------------------------------------------------
+
+def parse_srm_profile(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    data = {
+        "Name": "",
+        "Designation": "",
+        "Email": "",
+        "Bio": "",
+        "Research Interests": ""
+    }
+
+    name_el = soup.find(['h1', 'h2'], class_='elementor-heading-title')
+    if name_el:
+        data["Name"] = name_el.get_text(strip=True)
+
+    heading_tags = soup.find_all(['h2', 'h3', 'h4'])
+    for tag in heading_tags:
+        if 'Professor' in tag.get_text() or 'Head' in tag.get_text():
+            data["Designation"] = tag.get_text(strip=True)
+            break
+
+    email_tag = soup.find('a', href=re.compile(r'mailto:', re.I))
+    if email_tag:
+        data["Email"] = email_tag.get_text(strip=True)
+    else:
+        email_fallback = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', soup.get_text())
+        if email_fallback:
+            data["Email"] = email_fallback.group()
+
+    paragraphs = soup.find_all('p')
+    for p in paragraphs:
+        text = p.get_text(strip=True)
+        if len(text) > 100 and not re.search(r'@|research|course', text, re.I):
+            data["Bio"] = text
+            break
+
+    for heading in soup.find_all(['h2', 'h3', 'h4']):
+        if 'research interest' in heading.get_text(strip=True).lower():
+            interests = []
+            next_tag = heading.find_next_sibling()
+            while next_tag and next_tag.name in ['ul', 'ol', 'p']:
+                if next_tag.name in ['ul', 'ol']:
+                    interests += [li.get_text(strip=True) for li in next_tag.find_all('li')]
+                elif next_tag.name == 'p':
+                    interests.append(next_tag.get_text(strip=True))
+                next_tag = next_tag.find_next_sibling()
+            data["Research Interests"] = "; ".join(interests)
+            break
+
+    return [data]
+
+
+# ---------------------------------------------------------------------------
+# VIT (faculty lightbox) - code_vit.py
+# ---------------------------------------------------------------------------
+
+def parse_vit_modal(html):
+    soup = BeautifulSoup(html, 'html.parser')
+
+    resume_section = soup.find('div', class_='resume-section-content')
+    if resume_section:
+        primary_text = resume_section.find('div', class_='text-primary').text.strip() if resume_section.find('div', class_='text-primary') else "Not Found"
+        subheading_text = resume_section.find('div', class_='subheading mb-5').text.strip() if resume_section.find('div', class_='subheading mb-5') else "Not Found"
+    else:
+        primary_text = "Not Found"
+        subheading_text = "Not Found"
+
+    research_interest_section = soup.find('div', class_='resume-section-content table-responsive-sm')
+    if research_interest_section:
+        ul_element = research_interest_section.find('ul', class_='fa-ul mb-0')
+        if ul_element:
+            research_interests = [li.text.strip() for li in ul_element.find_all('li')]
+        else:
+            research_interests = ["Not Found"]
+    else:
+        research_interests = ["Not Found"]
+
+    return [{
+        "Name": primary_text,
+        "Designation": subheading_text,
+        "Research Interests": research_interests,
+    }]
+
+
+# ---------------------------------------------------------------------------
+# UManitoba (Drupal directory + profile pages) - code_uni.py
+# ---------------------------------------------------------------------------
+
+def element_text(tag):
+    """
+    Text of an element as Selenium's WebElement.text renders it: <br> and
+    block elements break lines before and after them, inline markup (links,
+    spans) does not, and script/style contents are left out.
+    """
+    parts = []
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, NavigableString):
+                # Comments, doctypes and the like are not rendered
+                if not isinstance(child, PreformattedString):
+                    parts.append(re.sub(r"\s+", " ", str(child)))
+            elif child.name in HIDDEN_TAGS:
+                continue
+            elif child.name in BLOCK_TAGS:
+                parts.append("\n")
+                walk(child)
+                parts.append("\n")
+            else:
+                walk(child)
+
+    walk(tag)
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def parse_umanitoba_directory(html, base_url=None):
+    """Return (name, absolute link) pairs from a department directory page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    faculty_links = []
+    for div in soup.select(UMANITOBA_CONTENT_SELECTOR):
+        anchor = div.find('a', href=True)
+        if not anchor:
+            continue
+        name = element_text(div).split("\n")[0]
+        link = urljoin(base_url, anchor['href']) if base_url else anchor['href']
+        faculty_links.append((name, link))
+    return faculty_links
+
+
+def parse_umanitoba_profile(html, name=None):
+    soup = BeautifulSoup(html, 'html.parser')
+    if name is None:
+        title = soup.find('h1')
+        name = title.get_text(strip=True) if title else ""
+
+    data = {'Name': name, 'H2 Headings': [], 'Paragraphs': [], 'Research Interests': []}
+
+    main_div = soup.select_one(UMANITOBA_CONTENT_SELECTOR)
+    if main_div:
+        data['H2 Headings'] = [text for text in map(element_text, main_div.find_all('h2')) if text]
+        data['Paragraphs'] = [text for text in map(element_text, main_div.find_all('p')) if text]
+    else:
+        logger.warning(f"Could not find main content div for {name}")
+
+    research_section = soup.find(id='research-and-teaching-interests')
+    research_div = research_section.select_one(UMANITOBA_RESEARCH_SELECTOR) if research_section else None
+    if research_div:
+        data['Research Interests'] = [text for text in map(element_text, research_div.find_all('li')) if text]
+    else:
+        logger.warning(f"No research section found for {name}")
+
+    return [data]
+
+
+# Site name -> parser used by `cli.py parse`
+PARSERS = {
+    "ualberta": parse_ualberta_page,
+    "srm": parse_srm_profile,
+    "vit": parse_vit_modal,
+    "umanitoba": parse_umanitoba_profile,
+}
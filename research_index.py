@@ -0,0 +1,498 @@
+"""
+Persistent inverted index and BM25 search over scraped faculty profiles.
+
+Every scraper writes research data in its own shape - `keywords` lists from
+UAlberta, "; "-joined interests from SRM, " | "-joined columns from
+UManitoba and Python list reprs from VIT. `normalize_record` maps any of
+those rows (CSV or the JSON lines written by `cli.py parse`/`reextract`) to
+one document layout, and `ResearchIndex` indexes interests, bios, positions
+and names with BM25 scoring done in NumPy.
+
+On disk (default `./index`):
+
+    manifest.json          indexed files, segment names, filter vocabularies
+    docs.jsonl             normalized documents, append-only
+    doc_*.npy              per-document offset, length, alive flag, filter codes
+    keys.json              document key (email/url/name) -> current doc id
+    seg_NNNNN.terms.json   term -> [start, end) slice of the segment postings
+    seg_NNNNN.docs.npy     posting doc ids
+    seg_NNNNN.tf.npy       field-weighted term frequencies
+
+Each `add_files` call writes one new segment; re-indexed profiles supersede
+their old document through the alive flag. Queries memory-map the segment
+postings and read only the top-k documents from docs.jsonl - no CSV is
+loaded. The per-document arrays are small and are rewritten on every add, so
+they are read into memory instead (replacing a mapped file fails on Windows).
+"""
+import ast
+import csv
+import json
+import math
+import os
+import re
+
+import numpy as np
+
+INDEX_DIR = os.environ.get("RESEARCH_INDEX_DIR", "index")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# How much one occurrence of a term counts in each field (the designation
+# is always one of the positions, so it is not indexed twice)
+FIELD_WEIGHTS = {
+    "interests": 3.0,
+    "positions": 2.0,
+    "department": 1.0,
+    "name": 1.0,
+    "bio": 1.0,
+}
+
+# Merge all segments into one once there are more than this many
+MAX_SEGMENTS = 16
+
+MISSING_VALUES = {"", "n/a", "null", "none", "nan", "not found", "position information not available"}
+
+# Coveo placeholder that shows up as a UAlberta keyword on every card
+NOISE_KEYWORDS = {"peoplev2"}
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "the", "to", "with", "its", "their", "this", "that",
+}
+
+# Fields of which a profile needs at least one; rows with only a name are
+# section headings such as UManitoba's "Department heads"
+PROFILE_FIELDS = ("designation", "interests", "positions", "bio", "email")
+
+# Sites whose archived snapshot is the profile page itself, so the
+# `source_url` added by reextract identifies the profile. VIT snapshots are
+# modals on a shared listing page and UAlberta ones are result pages.
+PROFILE_PAGE_SITES = {"srm", "umanitoba"}
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+EMAIL_RE = re.compile(r"[\w\.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}\b")
+
+
+# ---------------------------------------------------------------------------
+# Normalization
+# ---------------------------------------------------------------------------
+
+def _clean(value):
+    value = (value or "").strip() if isinstance(value, str) else value
+    if value is None or (isinstance(value, str) and value.lower() in MISSING_VALUES):
+        return ""
+    return value
+
+
+def split_field(value, sep):
+    """Turn a list, a Python list repr or a `sep`-joined string into a clean list"""
+    value = _clean(value)
+    if not value:
+        return []
+    if isinstance(value, str) and value.startswith("[") and value.endswith("]"):
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            pass
+    if isinstance(value, str):
+        value = value.split(sep)
+    items = [_clean(str(item)) for item in value]
+    return [item for item in items if item]
+
+
+def detect_site(record):
+    """Guess which scraper produced a row from its column names"""
+    if "profile_link" in record or "staff_positions" in record:
+        return "ualberta"
+    if "H2 Headings" in record:
+        return "umanitoba"
+    if "Bio" in record or "Email" in record:
+        return "srm"
+    return "vit"
+
+
+def normalize_record(record, site=None, department=None):
+    """
+    Map a scraped row from any site to the common document layout
+
+    Args:
+        record: dict from a scraper CSV or a parse/reextract JSON line
+        site: site name; detected from the columns when omitted
+        department: department to record when the row itself has none
+    """
+    site = site or detect_site(record)
+    source_url = _clean(record.get("source_url")) if site in PROFILE_PAGE_SITES else ""
+    doc = {
+        "site": site, "name": "", "email": "", "url": source_url,
+        "designation": "", "department": "", "interests": [], "positions": [], "bio": "",
+    }
+
+    if site == "ualberta":
+        doc["name"] = _clean(record.get("name"))
+        doc["email"] = _clean(record.get("email"))
+        doc["url"] = _clean(record.get("profile_link")) or doc["url"]
+        doc["positions"] = split_field(record.get("staff_positions"), ";")
+        doc["interests"] = [kw for kw in split_field(record.get("keywords"), ";") if kw.lower() not in NOISE_KEYWORDS]
+        doc["bio"] = _clean(record.get("bio"))
+        doc["designation"] = doc["positions"][0] if doc["positions"] else ""
+
+    elif site == "umanitoba":
+        doc["name"] = _clean(record.get("Name"))
+        doc["interests"] = split_field(record.get("Research Interests"), "|")
+        paragraphs = split_field(record.get("Paragraphs"), "|")
+        doc["bio"] = " ".join(paragraphs)
+        email = EMAIL_RE.search(doc["bio"])
+        doc["email"] = email.group() if email else ""
+        # The profile heading is "<name>\n<designation>, <roles>, <department>";
+        # CSVs join the headings with " | ", parse/reextract keep them as a list
+        headings = split_field(record.get("H2 Headings"), "|")
+        title = next((lines[1] for lines in (h.split("\n") for h in headings) if len(lines) > 1), "")
+        if title:
+            parts = [part.strip() for part in title.split(",") if part.strip()]
+            doc["positions"] = parts
+            doc["designation"] = parts[0] if parts else ""
+            if len(parts) > 1:
+                doc["department"] = parts[-1]
+
+    else:
+        # SRM and VIT share the capitalised column names
+        doc["name"] = _clean(record.get("Name"))
+        doc["email"] = _clean(record.get("Email"))
+        doc["url"] = _clean(record.get("Profile URL")) or doc["url"]
+        doc["designation"] = _clean(record.get("Designation"))
+        doc["positions"] = [doc["designation"]] if doc["designation"] else []
+        doc["interests"] = split_field(record.get("Research Interests"), ";")
+        doc["bio"] = _clean(record.get("Bio"))
+
+    doc["department"] = doc["department"] or (department or "")
+    return doc
+
+
+def document_key(doc):
+    """Identity used to replace an older copy of the same profile"""
+    if doc["email"]:
+        return "email:" + doc["email"].lower()
+    if doc["url"]:
+        return "url:" + doc["url"]
+    return f"name:{doc['site']}:{doc['name'].lower()}"
+
+
+def load_records(path):
+    """Yield row dicts from a scraper CSV or a JSON-lines file"""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith((".jsonl", ".json")):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            csv.field_size_limit(2 ** 31 - 1)
+            yield from csv.DictReader(f)
+
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+def _stem(token):
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [_stem(tok) for tok in TOKEN_RE.findall(text.lower()) if tok not in STOPWORDS]
+
+
+def _weighted_terms(doc):
+    """Field-weighted term frequencies and the document's weighted length"""
+    tf = {}
+    length = 0.0
+    for field, weight in FIELD_WEIGHTS.items():
+        value = doc[field]
+        text = " ".join(value) if isinstance(value, list) else value
+        for tok in tokenize(text):
+            tf[tok] = tf.get(tok, 0.0) + weight
+            length += weight
+    return tf, length
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+class ResearchIndex:
+    DOC_ARRAYS = {
+        "offset": np.int64, "length": np.float32, "alive": np.bool_,
+        "site": np.int32, "department": np.int32, "designation": np.int32,
+    }
+    FILTERS = ("site", "department", "designation")
+
+    def __init__(self, directory=None):
+        self.directory = directory or INDEX_DIR
+        self.manifest = self._read_json("manifest.json", {
+            "files": {}, "segments": [], "next_segment": 1,
+            "site": [], "department": [], "designation": [],
+        })
+        self.docs = {
+            name: self._load_array(f"doc_{name}.npy", dtype)
+            for name, dtype in self.DOC_ARRAYS.items()
+        }
+        self._segments = None
+
+    # -- storage helpers ----------------------------------------------------
+
+    def _require_manifest(self):
+        if not os.path.exists(self._path("manifest.json")):
+            raise FileNotFoundError(f"no research index in {self.directory!r}; run `cli.py index` first")
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _read_json(self, name, default):
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def _write_json(self, name, data):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self._path(name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self._path(name))
+
+    def _load_array(self, name, dtype):
+        path = self._path(name)
+        if os.path.exists(path):
+            return np.load(path)
+        return np.zeros(0, dtype=dtype)
+
+    def _save_array(self, name, array):
+        tmp = self._path(name + ".tmp.npy")
+        np.save(tmp, array)
+        os.replace(tmp, self._path(name))
+
+    def _read_segment(self, seg, mmap_mode="r"):
+        return (
+            self._read_json(f"{seg}.terms.json", {}),
+            np.load(self._path(f"{seg}.docs.npy"), mmap_mode=mmap_mode),
+            np.load(self._path(f"{seg}.tf.npy"), mmap_mode=mmap_mode),
+        )
+
+    def _segment_data(self):
+        """Lazily load term tables and memory-map the postings of every segment"""
+        if self._segments is None:
+            self._segments = [self._read_segment(seg) for seg in self.manifest["segments"]]
+        return self._segments
+
+    def _code(self, field, value):
+        vocab = self.manifest[field]
+        if value not in vocab:
+            vocab.append(value)
+        return vocab.index(value)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.docs["alive"]))
+
+    # -- indexing -----------------------------------------------------------
+
+    def add_files(self, paths, site=None, department=None, force=False):
+        """
+        Index scraper output files, skipping ones unchanged since the last run
+
+        Returns the number of distinct profiles added.
+        """
+        docs = []
+        changed = {}
+        for path in paths:
+            stat = os.stat(path)
+            key = os.path.abspath(path)
+            signature = [stat.st_size, stat.st_mtime_ns]
+            if not force and self.manifest["files"].get(key) == signature:
+                continue
+            docs.extend(normalize_record(record, site, department) for record in load_records(path))
+            changed[key] = signature
+
+        added = self.add_documents(docs)
+        self.manifest["files"].update(changed)
+        self._write_json("manifest.json", self.manifest)
+        return added
+
+    def add_documents(self, docs):
+        """
+        Append normalized documents as a new segment
+
+        Returns the number of distinct profiles added, i.e. new documents
+        still live after duplicates within the batch replaced each other.
+        """
+        docs = [doc for doc in docs if doc["name"] and any(doc[field] for field in PROFILE_FIELDS)]
+        if not docs:
+            return 0
+
+        keys = self._read_json("keys.json", {})
+        arrays = {name: [array] for name, array in self.docs.items()}
+        alive = self.docs["alive"].copy()
+        first_id = len(alive)
+        postings = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path("docs.jsonl"), "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            new = {name: [] for name in self.DOC_ARRAYS}
+            for i, doc in enumerate(docs):
+                doc_id = first_id + i
+                previous = keys.get(document_key(doc))
+                if previous is not None:
+                    if previous < first_id:
+                        alive[previous] = False
+                    else:
+                        new["alive"][previous - first_id] = False
+                keys[document_key(doc)] = doc_id
+
+                line = (json.dumps(doc, ensure_ascii=False) + "\n").encode("utf-8")
+                f.write(line)
+                tf, length = _weighted_terms(doc)
+                for term, weight in tf.items():
+                    postings.setdefault(term, []).append((doc_id, weight))
+
+                new["offset"].append(offset)
+                new["length"].append(length)
+                new["alive"].append(True)
+                for field in self.FILTERS:
+                    new[field].append(self._code(field, doc[field]))
+                offset += len(line)
+
+        arrays["alive"] = [alive]
+        for name, dtype in self.DOC_ARRAYS.items():
+            arrays[name].append(np.asarray(new[name], dtype=dtype))
+            self.docs[name] = np.concatenate(arrays[name]).astype(dtype, copy=False)
+            self._save_array(f"doc_{name}.npy", self.docs[name])
+        self._write_json("keys.json", keys)
+
+        self._write_segment(postings)
+        if len(self.manifest["segments"]) > MAX_SEGMENTS:
+            self.compact()
+        self._write_json("manifest.json", self.manifest)
+        return sum(new["alive"])
+
+    def _write_segment(self, postings):
+        seg = f"seg_{self.manifest['next_segment']:05d}"
+        self.manifest["next_segment"] += 1
+
+        terms = {}
+        doc_ids = []
+        weights = []
+        for term in sorted(postings):
+            start = len(doc_ids)
+            for doc_id, weight in postings[term]:
+                doc_ids.append(doc_id)
+                weights.append(weight)
+            terms[term] = [start, len(doc_ids)]
+
+        np.save(self._path(f"{seg}.docs.npy"), np.asarray(doc_ids, dtype=np.int32))
+        np.save(self._path(f"{seg}.tf.npy"), np.asarray(weights, dtype=np.float32))
+        self._write_json(f"{seg}.terms.json", terms)
+        self.manifest["segments"].append(seg)
+        self._segments = None
+
+    def compact(self):
+        """Merge every segment into one, dropping postings of superseded documents"""
+        alive = self.docs["alive"]
+        merged = {}
+        # Read the old segments into memory so their files can be removed afterwards
+        self._segments = None
+        for seg in self.manifest["segments"]:
+            terms, doc_ids, weights = self._read_segment(seg, mmap_mode=None)
+            for term, (start, end) in terms.items():
+                keep = alive[doc_ids[start:end]]
+                if keep.any():
+                    merged.setdefault(term, []).append((doc_ids[start:end][keep], weights[start:end][keep]))
+
+        old_segments = self.manifest["segments"]
+        self.manifest["segments"] = []
+        postings = {
+            term: list(zip(np.concatenate([ids for ids, _ in parts]).tolist(),
+                           np.concatenate([w for _, w in parts]).tolist()))
+            for term, parts in merged.items()
+        }
+        self._write_segment(postings)
+        self._write_json("manifest.json", self.manifest)
+
+        for seg in old_segments:
+            for suffix in (".terms.json", ".docs.npy", ".tf.npy"):
+                os.remove(self._path(seg + suffix))
+
+    # -- querying -----------------------------------------------------------
+
+    def _filter_mask(self, field, value, exact=False):
+        """Docs whose `field` matches `value` (case-insensitive substring unless exact)"""
+        value = value.lower()
+        codes = [
+            code for code, text in enumerate(self.manifest[field])
+            if (text.lower() == value if exact else value in text.lower())
+        ]
+        return np.isin(self.docs[field], codes)
+
+    def search(self, query, k=10, site=None, department=None, designation=None):
+        """
+        Rank live documents against `query` with BM25
+
+        Returns up to `k` (score, document) pairs, best first.
+        """
+        if k < 1:
+            raise ValueError(f"k must be a positive integer, got {k}")
+        self._require_manifest()
+        n_docs = len(self.docs["alive"])
+        terms = set(tokenize(query))
+        if not n_docs or not terms:
+            return []
+
+        alive = self.docs["alive"]
+        lengths = self.docs["length"]
+        n_live = int(np.count_nonzero(alive))
+        avgdl = float(lengths[alive].mean()) if n_live else 1.0
+        norm = K1 * (1 - B + B * lengths / (avgdl or 1.0))
+
+        scores = np.zeros(n_docs, dtype=np.float64)
+        for term in terms:
+            parts = [
+                (doc_ids[start:end], weights[start:end])
+                for terms_table, doc_ids, weights in self._segment_data()
+                for start, end in [terms_table.get(term, (0, 0))]
+                if end > start
+            ]
+            if not parts:
+                continue
+            ids = np.concatenate([ids for ids, _ in parts])
+            tf = np.concatenate([w for _, w in parts]).astype(np.float64)
+            live = alive[ids]
+            ids, tf = ids[live], tf[live]
+            df = len(ids)
+            if not df:
+                continue
+            idf = math.log(1 + (n_live - df + 0.5) / (df + 0.5))
+            scores += np.bincount(ids, weights=idf * tf * (K1 + 1) / (tf + norm[ids]), minlength=n_docs)
+
+        mask = alive & (scores > 0)
+        if site:
+            mask &= self._filter_mask("site", site, exact=True)
+        if department:
+            mask &= self._filter_mask("department", department)
+        if designation:
+            mask &= self._filter_mask("designation", designation)
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(float(scores[doc_id]), self.document(doc_id)) for doc_id in candidates]
+
+    def document(self, doc_id):
+        with open(self._path("docs.jsonl"), "rb") as f:
+            f.seek(int(self.docs["offset"][doc_id]))
+            return json.loads(f.readline())